@@ -11,122 +11,207 @@ import pandas as pd
 import gspread
 from google.oauth2 import service_account
 from datetime import datetime
-import time
 import json
+import os
+
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+SERVICE_ACCOUNT_FILE = 'golf-outing-468018-a5bee528ee1c.json'
+PLAYERS_FILE = 'players_2024.json'
+
+# Dark theme CSS with custom font
+DARK_CSS = """
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+<style>
+    * {
+        font-family: 'Inter', sans-serif;
+    }
+    .stApp {
+        background-color: #0E1117;
+        color: #FAFAFA;
+    }
+    .stDataFrame {
+        background-color: #262730;
+    }
+    h1, h2, h3 {
+        color: #FAFAFA;
+        font-family: 'Inter', sans-serif;
+    }
+    .stMarkdown {
+        color: #FAFAFA;
+    }
+    /* Dark header/navigation */
+    header {
+        background-color: #0E1117 !important;
+    }
+    .stDeployButton {
+        background-color: #262730 !important;
+    }
+    /* Hide the hamburger menu and other header elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+</style>
+"""
+
+# (display label, sheet column) for each scoring entry on the player page
+ROUND_COLUMNS = [
+    ('Round 1', 'R1'),
+    ('Round 2', 'R2'),
+    ('Round 3', 'R3'),
+    ('Round 4', 'R4'),
+    ('Round 5', 'R5'),
+    ('Putt-Off', 'Putt-Off'),
+    ('Extras', 'Extras')
+]
+
+# Icons for specific players; past champions otherwise get a trophy
+CHAMPION_ICONS = {'Gunter': '👑'}  # Defending champion
+
+# Accent colors for each team's leaderboard cards
+TEAM_COLORS = {
+    'Red': '#e74c3c',
+    'Blue': '#3498db',
+    'Green': '#2ecc71',
+    'Yellow': '#f1c40f',
+    'Purple': '#9b59b6',
+    'Orange': '#e67e22',
+    'Pink': '#e91e63',
+    'Teal': '#1abc9c',
+    'Brown': '#8b4513',
+    'Gray': '#95a5a6',
+    'Black': '#2d2d2d',
+    'White': '#ecf0f1'
+}
+
+@st.cache_resource
+def _credentials():
+    """
+    Load the service account credentials once per process.
+    """
+    # Try to get credentials from Streamlit secrets first, fall back to file
+    if 'gcp_service_account' in st.secrets:
+        return service_account.Credentials.from_service_account_info(
+            dict(st.secrets['gcp_service_account']), scopes=SCOPES)
+    return service_account.Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+
+@st.cache_resource
+def _get_sheet():
+    """
+    Authorize against Google Sheets and open the leaderboard spreadsheet.
+    """
+    gc = gspread.authorize(_credentials())
+    return gc.open_by_key('1qkLn1UmfjTYy76L1rL_G7O-siGcHBolIYdELjTMSFV4')
+
+def _rows_to_dataframe(rows):
+    """
+    Build a DataFrame from raw sheet values, using the first row as headers.
+    """
+    if not rows:
+        return pd.DataFrame()
+    
+    header, records = rows[0], rows[1:]
+    # The Sheets API drops trailing empty cells (header included), so pad short
+    # rows and trim values that sit in unlabelled columns past the header
+    records = [row[:len(header)] + [''] * (len(header) - len(row)) for row in records]
+    return pd.DataFrame(records, columns=header)
+
+def _players_file_mtime():
+    """
+    Return the players file's modification time, or None if it is missing.
+    """
+    try:
+        return os.path.getmtime(PLAYERS_FILE)
+    except OSError:
+        return None
+
+@st.cache_data(persist="disk", max_entries=1)
+def _read_past_champions(modified_time):
+    """
+    Parse the past champions out of the players JSON file.
+    
+    The result is persisted to disk, keyed on the file's modification time, so
+    it is only reused across process restarts within the same checkout; a fresh
+    checkout or an edit gives the file a new mtime and a new entry. Errors are
+    left to propagate so a failed parse is never cached.
+    """
+    # Only runs on a cache miss: drop entries for older mtimes so their
+    # pickles don't accumulate on disk (max_entries only bounds memory)
+    _read_past_champions.clear()
+    
+    with open(PLAYERS_FILE, 'r') as f:
+        data = json.load(f)
+    
+    return frozenset(
+        player_data['name']
+        for player_data in data['players'].values()
+        if player_data.get('past_champion', False)
+    )
 
 def load_past_champions():
     """
     Load past champions from the players JSON file.
+    
+    Returns a frozenset for fast membership checks while rendering.
     """
     try:
-        with open('players_2024.json', 'r') as f:
-            data = json.load(f)
-        
-        past_champions = []
-        for player_id, player_data in data['players'].items():
-            if player_data.get('past_champion', False):
-                past_champions.append(player_data['name'])
-        
-        return past_champions
+        return _read_past_champions(_players_file_mtime())
     except Exception as e:
         st.error(f"Error loading past champions: {e}")
-        return []
+        return frozenset()
 
 def load_player_round_data(player_name):
     """
     Load round-by-round data for a specific player from Google Sheets.
     """
     try:
-        # Set up credentials
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-        
-        # Try to get credentials from Streamlit secrets first, fall back to file
-        if 'gcp_service_account' in st.secrets:
-            credentials = service_account.Credentials.from_service_account_info(
-                st.secrets['gcp_service_account'], scopes=SCOPES)
-        else:
-            SERVICE_ACCOUNT_FILE = 'golf-outing-468018-a5bee528ee1c.json'
-            credentials = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        
-        # Connect to Google Sheets
-        gc = gspread.authorize(credentials)
-        
-        # Open the sheet
-        sheet = gc.open_by_key('1qkLn1UmfjTYy76L1rL_G7O-siGcHBolIYdELjTMSFV4')
-        
-        # Get individual leaderboard which should have round-by-round data
-        individual_worksheet = sheet.worksheet('Individual Leaderboard')
-        individual_data = individual_worksheet.get_all_records()
+        # Reuse the cached individual leaderboard, which has round-by-round data
+        df_individual, _ = load_data_from_sheets()
+        if df_individual is None or 'Player' not in df_individual:
+            return {}
         
         # Find the player's row
-        player_row = None
-        for row in individual_data:
-            if row.get('Player') == player_name:
-                player_row = row
-                break
-        
-        if not player_row:
+        matches = df_individual[df_individual['Player'] == player_name]
+        if matches.empty:
             return {}
+        player_row = matches.iloc[0].to_dict()
         
         # Extract round-by-round data using the correct column names
         round_data = {}
-        for round_num in [1, 2, 3, 4, 5]:
-            round_key = f'R{round_num}'
-            if round_key in player_row and player_row[round_key] is not None and player_row[round_key] != '':
-                round_data[f'Round {round_num}'] = {
-                    'points': player_row[round_key]
+        for label, key in ROUND_COLUMNS:
+            points = player_row.get(key)
+            if points is not None and points != '':
+                round_data[label] = {
+                    'points': points
                 }
         
-        # Add Putt-Off and Extras
-        if 'Putt-Off' in player_row and player_row['Putt-Off'] is not None and player_row['Putt-Off'] != '':
-            round_data['Putt-Off'] = {
-                'points': player_row['Putt-Off']
-            }
-        
-        if 'Extras' in player_row and player_row['Extras'] is not None and player_row['Extras'] != '':
-            round_data['Extras'] = {
-                'points': player_row['Extras']
-            }
-        
         return round_data
         
     except Exception as e:
         st.error(f"Error loading player round data: {e}")
         return {}
 
+@st.cache_data(ttl=30, show_spinner=False)
 def load_data_from_sheets():
     """
     Load leaderboard data directly from Google Sheets.
     """
     try:
-        # Set up credentials
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+        # Open the sheet (authorized client is cached per process)
+        sheet = _get_sheet()
         
-        # Try to get credentials from Streamlit secrets first, fall back to file
-        if 'gcp_service_account' in st.secrets:
-            credentials = service_account.Credentials.from_service_account_info(
-                st.secrets['gcp_service_account'], scopes=SCOPES)
-        else:
-            SERVICE_ACCOUNT_FILE = 'golf-outing-468018-a5bee528ee1c.json'
-            credentials = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+        # Get individual and team leaderboards in a single batchGet request
+        response = sheet.values_batch_get(
+            ["'Individual Leaderboard'", "'Team Leaderboard'"],
+            params={'valueRenderOption': 'UNFORMATTED_VALUE'})
+        individual_range, team_range = response['valueRanges']
+        df_individual = _rows_to_dataframe(individual_range.get('values', []))
+        df_team = _rows_to_dataframe(team_range.get('values', []))
         
-        # Connect to Google Sheets
-        gc = gspread.authorize(credentials)
-        
-        # Open the sheet
-        sheet = gc.open_by_key('1qkLn1UmfjTYy76L1rL_G7O-siGcHBolIYdELjTMSFV4')
-        
-        # Get individual leaderboard
-        individual_worksheet = sheet.worksheet('Individual Leaderboard')
-        individual_data = individual_worksheet.get_all_records()
-        df_individual = pd.DataFrame(individual_data)
-        
-        # Get team leaderboard
-        team_worksheet = sheet.worksheet('Team Leaderboard')
-        team_data = team_worksheet.get_all_records()
-        df_team = pd.DataFrame(team_data)
+        # Coerce point totals to numbers once; blank cells become <NA>
+        for df in (df_individual, df_team):
+            if 'Total' in df:
+                df['Total'] = pd.to_numeric(df['Total'], errors='coerce').convert_dtypes()
         
         return df_individual, df_team
         
@@ -136,42 +221,10 @@ def load_data_from_sheets():
 
 def main():
     # Add dark theme CSS with custom font
-    st.markdown("""
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {
-            font-family: 'Inter', sans-serif;
-        }
-        .stApp {
-            background-color: #0E1117;
-            color: #FAFAFA;
-        }
-        .stDataFrame {
-            background-color: #262730;
-        }
-        h1, h2, h3 {
-            color: #FAFAFA;
-            font-family: 'Inter', sans-serif;
-        }
-        .stMarkdown {
-            color: #FAFAFA;
-        }
-        /* Dark header/navigation */
-        header {
-            background-color: #0E1117 !important;
-        }
-        .stDeployButton {
-            background-color: #262730 !important;
-        }
-        /* Hide the hamburger menu and other header elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(DARK_CSS, unsafe_allow_html=True)
     
     # Check if we're viewing a specific player
-    player_name = st.query_params.get("player", None)
+    player_name = st.query_params.get("player")
     
     if player_name:
         show_player_detail(player_name)
@@ -182,10 +235,8 @@ def show_player_detail(player_name):
     """Show detailed round-by-round breakdown for a specific player."""
     st.title(f"🏌️ {player_name}'s Performance")
     
-    # Back button
-    if st.button("← Back to Leaderboard"):
-        st.query_params.clear()
-        st.rerun()
+    # Back link; dropping the query string returns to the leaderboard in one rerun
+    st.markdown('<a href="?" target="_self">← Back to Leaderboard</a>', unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -222,6 +273,29 @@ def show_player_detail(player_name):
     st.markdown("---")
     st.markdown(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
 
+def build_individual_table(df_individual, past_champions):
+    """Build the individual leaderboard table with champion icons."""
+    # reindex keeps the table usable when the sheet is still blank
+    table = df_individual.reindex(columns=['Rank', 'Player', 'Team', 'Total'])
+    
+    # Ranks mix numbers with tie labels like 'T2', so show them as text
+    table['Rank'] = table['Rank'].astype(str)
+    
+    # Defending champion gets a crown, other past champions a trophy
+    table['Champion'] = table['Player'].map(
+        lambda name: CHAMPION_ICONS.get(name, "🏆" if name in past_champions else ""))
+    return table
+
+def build_team_table(df_team):
+    """Build the team leaderboard table."""
+    table = df_team.reindex(columns=['Rank', 'Team', 'Players', 'Total'])
+    table['Rank'] = table['Rank'].astype(str)
+    return table
+
+def _team_color_style(team, default):
+    """Color a team name with its accent color, or default if the team is unknown."""
+    return f"color: {TEAM_COLORS.get(team, default)}"
+
 def show_main_leaderboard():
     """Show the main leaderboard."""
     # Display custom logo and title
@@ -232,6 +306,11 @@ def show_main_leaderboard():
         st.title("The 'Jimmy D' Carroll Valley Open")
     st.markdown("---")
     
+    show_leaderboards()
+
+@st.fragment(run_every=30)
+def show_leaderboards():
+    """Show the individual and team leaderboards, refreshing every 30 seconds."""
     # Load data from Google Sheets and past champions
     df_individual, df_team = load_data_from_sheets()
     past_champions = load_past_champions()
@@ -246,118 +325,40 @@ def show_main_leaderboard():
     with col1:
         st.header("Individual Leaderboard")
         
-        # Create simplified individual display
-        for i, row in df_individual.iterrows():
-            rank = row['Rank']
-            name = row['Player']
-            team = row['Team']
-            total = row['Total']
-            
-            # Get team color
-            team_colors = {
-                'Red': '#e74c3c',
-                'Blue': '#3498db', 
-                'Green': '#2ecc71',
-                'Yellow': '#f1c40f',
-                'Purple': '#9b59b6',
-                'Orange': '#e67e22',
-                'Pink': '#e91e63',
-                'Teal': '#1abc9c',
-                'Brown': '#8b4513',
-                'Gray': '#95a5a6',
-                'Black': '#2d2d2d',
-                'White': '#ecf0f1'
-            }
-            team_color = team_colors.get(team, '#3498db')  # Default to blue if team not found
-            
-            # Check if player is a past champion or defending champion
-            if name == "Gunter":  # Defending champion
-                champion_icon = "👑"
-            elif name in past_champions:
-                champion_icon = "🏆"
-            else:
-                champion_icon = ""
-            
-            # Create a styled container for each player
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(90deg, #2c3e50 0%, #34495e 100%);
-                border-radius: 10px;
-                padding: 15px;
-                margin: 10px 0;
-                border-left: 5px solid {team_color};
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <span style="font-size: 1.2em; font-weight: bold; color: #ecf0f1;">#{rank} <a href="?player={name}" style="color: #ecf0f1; text-decoration: none; cursor: pointer;">{name}</a> <span style="font-size: 0.8em;">{champion_icon}</span></span><br>
-                        <span style="color: #bdc3c7; font-size: 0.9em;">{team}</span>
-                    </div>
-                    <div style="text-align: right;">
-                        <span style="font-size: 1.5em; font-weight: bold; color: #f39c12;">{total}</span><br>
-                        <span style="color: #bdc3c7; font-size: 0.8em;">points</span>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        table = build_individual_table(df_individual, past_champions)
+        event = st.dataframe(
+            table.style.map(_team_color_style, subset=['Team'], default='#3498db'),
+            hide_index=True,
+            column_config={
+                'Player': st.column_config.TextColumn(help="Select a player to see their rounds"),
+                'Team': st.column_config.TextColumn(),
+                'Total': st.column_config.NumberColumn(format='%g pts'),
+            },
+            key="individual_leaderboard",
+            on_select="rerun",
+            selection_mode="single-row",
+        )
+        
+        # Open the selected player's round-by-round page in this tab
+        if event.selection.rows:
+            st.query_params["player"] = table['Player'].iloc[event.selection.rows[0]]
+            st.rerun(scope="app")
     
     with col2:
         st.header("Team Leaderboard")
         
-        # Create simplified team display
-        for i, row in df_team.iterrows():
-            rank = row['Rank']
-            team = row['Team']
-            total = row['Total']
-            players = row['Players']
-            
-            # Get team color
-            team_colors = {
-                'Red': '#e74c3c',
-                'Blue': '#3498db', 
-                'Green': '#2ecc71',
-                'Yellow': '#f1c40f',
-                'Purple': '#9b59b6',
-                'Orange': '#e67e22',
-                'Pink': '#e91e63',
-                'Teal': '#1abc9c',
-                'Brown': '#8b4513',
-                'Gray': '#95a5a6',
-                'Black': '#2d2d2d',
-                'White': '#ecf0f1'
-            }
-            team_color = team_colors.get(team, '#e74c3c')  # Default to red if team not found
-            
-            # Create a styled container for each team
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(90deg, #2c3e50 0%, #34495e 100%);
-                border-radius: 10px;
-                padding: 15px;
-                margin: 10px 0;
-                border-left: 5px solid {team_color};
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <span style="font-size: 1.2em; font-weight: bold; color: #ecf0f1;">#{rank} {team}</span><br>
-                        <span style="color: #bdc3c7; font-size: 0.8em;">{players}</span>
-                    </div>
-                    <div style="text-align: right;">
-                        <span style="font-size: 1.5em; font-weight: bold; color: #f39c12;">{total}</span><br>
-                        <span style="color: #bdc3c7; font-size: 0.8em;">points</span>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.dataframe(
+            build_team_table(df_team).style.map(_team_color_style, subset=['Team'], default='#e74c3c'),
+            hide_index=True,
+            column_config={
+                'Team': st.column_config.TextColumn(),
+                'Total': st.column_config.NumberColumn(format='%g pts'),
+            },
+        )
     
     # Footer with last updated time
     st.markdown("---")
     st.markdown(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    
-    # Auto-refresh every 30 seconds
-    time.sleep(30)
-    st.rerun()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file